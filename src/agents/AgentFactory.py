@@ -1,3 +1,7 @@
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, Tuple
+
 from pydantic_ai import Agent
 from pydantic_ai.settings import ModelSettings
 from pydantic_ai.models.google import GoogleModel, GoogleModelSettings
@@ -6,11 +10,35 @@ from google.genai.types import HarmBlockThreshold, HarmCategory, SafetySettingDi
 from src.models import TrendCard
 
 
+# safety settings shared by every Google model
+_GOOGLE_SAFETY_SETTINGS = [
+    SafetySettingDict(
+        category=HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
+        threshold=HarmBlockThreshold.BLOCK_LOW_AND_ABOVE
+    )
+]
+
+
+@lru_cache(maxsize=8)
+def _google_model(model_name: str) -> GoogleModel:
+    """
+    Returns a GoogleModel for the given model name, re-using the instance (and its client)
+    across agents.
+    """
+    return GoogleModel(model_name)
+
+
 class AgentFactory:
     """
     A factory for creating and configuring pydantic-ai Agent instances.
+
+    Agents are cached by the configuration values they are built from, so repeated
+    requests for an identical configuration return the same Agent instance.
     """
 
+    _cache: Dict[Tuple, Agent] = {}
+    _lock = Lock()
+
     @staticmethod
     def create_agent(config: dict) -> Agent:
         """
@@ -30,19 +58,55 @@ class AgentFactory:
             Agent: An initialized Agent object configured as per the
             provided input configuration.
         """
+        key = AgentFactory.config_key(config)
+
+        with AgentFactory._lock:
+            agent = AgentFactory._cache.get(key)
+            if agent is None:
+                agent = AgentFactory._build_agent(config)
+                AgentFactory._cache[key] = agent
+
+        return agent
+
+    @staticmethod
+    def config_key(config: dict) -> Tuple:
+        """
+        Returns the configuration values an Agent is built from, with defaults filled in.
+
+        Two configurations with the same key produce identical agents, so the key is used
+        both to cache agents and, by callers, to cache the agents' output.
+
+        Args:
+            config (dict): A dictionary containing configuration parameters for creating
+                the agent, as passed to `create_agent`.
+
+        Returns:
+            Tuple: The model, temperature, max tokens, thinking budget, system prompt and
+            generator retries.
+        """
+        return (
+            config["model"],
+            config.get("temperature", 0.5),
+            config.get("max_tokens", 2048),
+            config.get("thinking_budget", 2048),
+            config["system_prompt"],
+            config.get("generator_retries", 3)
+        )
+
+    @staticmethod
+    def _build_agent(config: dict) -> Agent:
+        """
+        Builds a new Agent from the provided configuration, bypassing the cache.
+        """
         # the Google API is different from those for OpenAI, Anthropic, etc., so need google-specific code
         if config["model"].startswith("gemini"):
-            safety_settings = SafetySettingDict(
-                category=HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-                threshold=HarmBlockThreshold.BLOCK_LOW_AND_ABOVE
-            )
             settings = GoogleModelSettings(
                 temperature=config.get("temperature", 0.5),
                 max_tokens=config.get("max_tokens", 2048),
                 google_thinking_config={'thinking_budget': config.get("thinking_budget", 2048)},
-                google_safety_settings=[safety_settings]
+                google_safety_settings=_GOOGLE_SAFETY_SETTINGS
             )
-            model = GoogleModel(config["model"])
+            model = _google_model(config["model"])
         else:
             settings=ModelSettings(
                 max_tokens=config.get("max_tokens", 2048),
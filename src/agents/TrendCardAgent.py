@@ -1,10 +1,54 @@
-from typing import Dict
+import asyncio
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from string import Formatter
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from pydantic_ai import Agent
 
 from src.agents.AgentFactory import AgentFactory
 from src.models import TrendCard, TrendCardInput, AgentConfiguration
 from src.utils.configuration import load_config
+from src.utils.fileio import read_file, write_file
+
+
+# table used for translating characters in model names that are unsafe in directory names
+_DIRECTORY_SAFE_TABLE = str.maketrans('.:-', '___')
+
+
+@lru_cache(maxsize=None)
+def _directory_safe_name(model: str) -> str:
+    """
+    Returns the model name with directory-unsafe characters replaced, memoized per model name.
+    """
+    return model.translate(_DIRECTORY_SAFE_TABLE)
+
+
+@lru_cache(maxsize=None)
+def _trend_card_schema_fingerprint() -> str:
+    """
+    Returns a hash of the TrendCard JSON schema, so cached cards are not re-used once the model changes.
+    """
+    schema = json.dumps(TrendCard.model_json_schema(), sort_keys=True)
+    return hashlib.blake2b(schema.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _compile_template(template: str) -> List[Tuple[str, Optional[str], str]]:
+    """
+    Splits a str.format-style template into (literal text, field name, format spec) segments
+    once, so it can be rendered repeatedly without re-parsing.
+
+    Raises:
+        ValueError: If the template is malformed or uses a conversion such as '!r'.
+    """
+    segments = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if conversion:
+            raise ValueError(f"Conversion '!{conversion}' is not supported in prompt templates.")
+        segments.append((literal, field_name, format_spec or ""))
+    return segments
 
 
 class TrendCardAgent:
@@ -23,12 +67,13 @@ class TrendCardAgent:
             on user inputs.
         model (str): The model used by the agent for generating results.
         agent (Agent): The core agent instance responsible for executing prompts.
-        translation_table (dict): Table used for translating unsafe characters in
-            model names to directory-safe characters.
+        use_cache (bool): Whether generated trend cards are cached on disk and re-used for
+            identical requests instead of calling the model again.
+        cache_dir (str): Directory where cached trend cards are stored.
     """
 
     def __init__(self, config_path: str = "src/agents/config",  config_file_name: str = "trend_card_agent.yaml",
-                 settings: AgentConfiguration = None):
+                 settings: AgentConfiguration = None, use_cache: bool = True, cache_dir: str = "../cache"):
         """
         Initializes the configuration and sets up the agent with the provided or default parameters.
 
@@ -37,6 +82,9 @@ class TrendCardAgent:
             config_file_name (str): Name of the configuration file to be loaded.
             settings (AgentConfiguration): Optional configuration settings to overwrite the
                 defaults in the configuration file.
+            use_cache (bool): Whether to cache generated trend cards on disk and re-use them for
+                identical requests. Defaults to True.
+            cache_dir (str): Directory where cached trend cards are stored. Defaults to "../cache".
 
         """
 
@@ -51,6 +99,14 @@ class TrendCardAgent:
         self.prompt_template = config["prompt_template"]
         self.model = config["model"]
 
+        # parse the prompt template once rather than on every call
+        self._prompt_segments = _compile_template(self.prompt_template)
+
+        # everything besides the prompt that determines the generated card, used to key the cache
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
+        self._cache_key_base = [*AgentFactory.config_key(config), _trend_card_schema_fingerprint()]
+
         # create the agent
         self.agent = AgentFactory.create_agent(config)
 
@@ -63,6 +119,10 @@ class TrendCardAgent:
         input object to create a query. The query is then passed to an agent which
         executes the operation and provides the result.
 
+        If caching is enabled and an identical request (same agent settings - model, temperature,
+        max tokens, thinking budget, system prompt and generator retries - TrendCard schema and
+        prompt) was made before, the cached trend card is returned without calling the model.
+
         Args:
             inputs (TrendCardInput): Input object containing values for industry
                 segment, topic, component, and word limit.
@@ -70,29 +130,107 @@ class TrendCardAgent:
         Returns:
             TrendCard: Generated trend card containing the requested components.
         """
+        prompt = self._build_prompt(inputs)
 
-        # create the finished prompt
-        prompt = self.prompt_template.format(
-            industry_segment=inputs.industry_segment,
-            topic=inputs.topic,
-            component=inputs.component,
-            word_limit=inputs.word_limit
-        )
+        if self.use_cache:
+            cache_path = self._get_cache_path(prompt)
+            trend_card = await asyncio.to_thread(self._load_cached, cache_path)
+            if trend_card is not None:
+                return trend_card
 
         # Run the agent
         result = await self.agent.run(prompt)
+
+        if self.use_cache:
+            await asyncio.to_thread(self._save_cached, cache_path, result.output)
+
         return result.output
 
 
+    async def stream_trend_card(self, inputs: TrendCardInput) -> AsyncIterator[TrendCard]:
+        """
+        Generates a trend card like `generate_trend_card`, but streams the model response and
+        yields the card as it fills in.
+
+        Each yielded TrendCard holds the fields received so far (the last field may be cut
+        off mid-sentence); the final one yielded is the complete card.
+
+        Args:
+            inputs (TrendCardInput): Input object containing values for industry
+                segment, topic, component, and word limit.
+
+        Yields:
+            TrendCard: Progressively more complete versions of the generated trend card.
+        """
+        async with self.agent.run_stream(self._build_prompt(inputs)) as result:
+            async for trend_card in result.stream_output():
+                yield trend_card
+
+
+    def _get_cache_path(self, prompt: str) -> Path:
+        """
+        Returns the cache file for a prompt, named by a hash of the prompt and the agent settings.
+        """
+        key = json.dumps(self._cache_key_base + [prompt])
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return Path(self.cache_dir) / f"{digest}.json"
+
+
+    @staticmethod
+    def _load_cached(cache_path: Path) -> Optional[TrendCard]:
+        """
+        Returns the trend card cached at the given path, or None if there is none or it is
+        unreadable (corrupt or truncated JSON, or missing some of the card's fields).
+        """
+        try:
+            data = json.loads(read_file(str(cache_path)))
+        except (FileNotFoundError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or any(name not in data for name in TrendCard.model_fields):
+            return None
+
+        # the cache only holds cards that were validated when they were generated
+        return TrendCard.from_trusted(data)
+
+
+    @staticmethod
+    def _save_cached(cache_path: Path, trend_card: TrendCard) -> None:
+        """
+        Writes a trend card to the given cache path.
+        """
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_file(str(cache_path), json.dumps(trend_card.model_dump()))
+
+
+    def _build_prompt(self, inputs: TrendCardInput) -> str:
+        """
+        Fills the pre-parsed prompt template with values from the input object.
+        """
+        values = {
+            "industry_segment": inputs.industry_segment,
+            "topic": inputs.topic,
+            "component": inputs.component,
+            "word_limit": inputs.word_limit
+        }
+        return "".join(
+            literal if field_name is None else literal + format(values[field_name], format_spec)
+            for literal, field_name, format_spec in self._prompt_segments
+        )
+
+
     async def generate_batch(self, industry_segment: str, topic_map: Dict[str, str],
-                             target_dir: str, word_limit: int = 40, verbose: bool = False) -> None:
+                             target_dir: str, word_limit: int = 40, verbose: bool = False,
+                             concurrency: int = 8) -> None:
         """
         Generates and processes a batch of trend cards for a given industry segment and saves them to a
         specified directory.
 
-        This method iterates through a dictionary of topic-to-component mappings, creates trend cards for
-        each topic, and saves the generated trend card to a specified directory. Optional verbosity provides
-        detailed processing outputs for each trend card.
+        This method creates a trend card for each topic in a dictionary of topic-to-component mappings and
+        saves the generated trend card to a specified directory. Up to `concurrency` cards are generated at
+        the same time, so cards are saved (and reported) in the order they finish. If any card fails, the
+        cards still in progress are cancelled and the error is raised. Optional verbosity provides detailed
+        processing outputs for each trend card.
 
         Args:
             industry_segment: String identifier for the industry segment being processed.
@@ -100,31 +238,64 @@ class TrendCardAgent:
             target_dir: Directory to save the resulting trend cards.
             word_limit: Word limit for each section of the trend card.
             verbose: Boolean indicating whether to print detailed progress during processing. Defaults to False.
+            concurrency: Maximum number of trend cards generated at the same time. Defaults to 8.
 
         Returns:
             None
+
+        Raises:
+            TypeError: If `industry_segment` is not a string, `word_limit` is not an int or None,
+                or `topic_map` has a key that is not a string or a value that is not a string or None.
+            ValueError: If `concurrency` is less than 1.
         """
+        # validate every card's inputs up front, so each card's TrendCardInput can be built without re-validating
+        if not isinstance(industry_segment, str):
+            raise TypeError(f"industry_segment must be a str, not {type(industry_segment).__name__}.")
+        if word_limit is not None and not isinstance(word_limit, int):
+            raise TypeError(f"word_limit must be an int or None, not {type(word_limit).__name__}.")
+        for topic, component in topic_map.items():
+            if not isinstance(topic, str):
+                raise TypeError(f"topic_map keys must be str, not {type(topic).__name__}.")
+            if component is not None and not isinstance(component, str):
+                raise TypeError(f"Component for topic '{topic}' must be a str or None, not {type(component).__name__}.")
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}.")
+
         list_len = len(topic_map)
         if verbose: print(f'Processing {list_len} topic{"s" if list_len > 1 else ""}...')
+        semaphore = asyncio.Semaphore(concurrency)
         i = 1
-        for topic, component in topic_map.items():
-            inputs = TrendCardInput(
+
+        async def process(topic: str, component: str) -> None:
+            nonlocal i
+            inputs = TrendCardInput.model_construct(
                 industry_segment=industry_segment,
                 topic=topic,
                 component=component,
                 word_limit=word_limit
             )
 
-            trend_card = await self.generate_trend_card(inputs)
-            trend_card.save_to_file(file_path=target_dir)
+            async with semaphore:
+                trend_card = await self.generate_trend_card(inputs)
+            await asyncio.to_thread(trend_card.save_to_file, file_path=target_dir)
 
             if verbose:
-                print(f"{i}: {trend_card.card_identifier}")
-                print("\nSECTION LENGTHS")
-                print(trend_card.get_length(), end="\n" * 2)
+                # emit each card's report with a single write so concurrent cards don't interleave
+                print(f"{i}: {trend_card.card_identifier}\n\nSECTION LENGTHS\n{trend_card.get_length()}\n\n", end="")
                 i += 1
 
+        # a task group cancels the cards still in flight as soon as one fails; re-raise that failure
+        # itself rather than the ExceptionGroup wrapping it, so callers see the original error
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for topic, component in topic_map.items():
+                    task_group.create_task(process(topic, component))
+        except ExceptionGroup as group:
+            raise group.exceptions[0]
+
 
-    translation_table = str.maketrans('.:-', '___')
     def get_directory_safe_model_name(self) -> str:
-         return self.model.translate(self.translation_table)
\ No newline at end of file
+        """
+        Returns the model name with '.', ':' and '-' replaced by '_' so it can be used as a directory name.
+        """
+        return _directory_safe_name(self.model)
@@ -1,3 +1,5 @@
+import asyncio
+from functools import lru_cache
 from typing import List
 from pydantic_ai import Agent
 
@@ -7,6 +9,14 @@ from src.utils.configuration import load_config
 from src.utils.fileio import read_file
 
 
+@lru_cache(maxsize=16)
+def _format_system_prompt(system_prompt: str, word_limit: int) -> str:
+    """
+    Returns the system prompt with the section word limit filled in, memoized per prompt and limit.
+    """
+    return system_prompt.format(word_limit=word_limit)
+
+
 class TrendCardEditor:
     """
     Handles the editing and batch processing of trend cards, leveraging configuration-based
@@ -47,7 +57,7 @@ class TrendCardEditor:
             config["temperature"] = settings.temperature
 
         # add word limit to system prompt
-        config["system_prompt"] = config["system_prompt"].format(word_limit=section_word_limit)
+        config["system_prompt"] = _format_system_prompt(config["system_prompt"], section_word_limit)
 
         # remember the model name
         self.model = config["model"]
@@ -75,29 +85,52 @@ class TrendCardEditor:
 
 
     async def edit_batch(self, file_list: List[str], target_dir: str,
-                         file_name_suffix: str, verbose: bool = False) -> None:
+                         file_name_suffix: str, verbose: bool = False, concurrency: int = 8) -> None:
         """
         Asynchronously edits a batch of text files and saves the modified content to a target directory. Each file's content is
         processed through the `edit_trend_card` method, and the resultant content is saved using the provided file name suffix.
+        Up to `concurrency` files are edited at the same time, so files are saved in the order they finish. If any file fails,
+        the files still in progress are cancelled and the error is raised.
 
         Args:
             file_list (List[str]): A list of file paths to be read and edited.
             target_dir (str): The directory where the edited files will be saved.
             file_name_suffix (str): A suffix appended to the file names of the edited files.
             verbose (bool, optional): Enables verbose mode to log processing details if set to True. Defaults to False.
+            concurrency (int, optional): Maximum number of files edited at the same time. Defaults to 8.
 
         Returns:
             None
+
+        Raises:
+            ValueError: If `concurrency` is less than 1.
         """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}.")
+
         list_len = len(file_list)
         if verbose: print(f'Editing {list_len} file{"s" if list_len > 1 else ""} in "{target_dir}"...')
+        semaphore = asyncio.Semaphore(concurrency)
         i = 1
-        for file in file_list:
-            text = read_file(file)
-            trend_card = await self.edit_trend_card(text)
-            saved_file_name = trend_card.save_to_file(file_path=target_dir, file_name_suffix=file_name_suffix)
+
+        async def process(file: str) -> None:
+            nonlocal i
+            async with semaphore:
+                text = await asyncio.to_thread(read_file, file)
+                trend_card = await self.edit_trend_card(text)
+            saved_file_name = await asyncio.to_thread(
+                trend_card.save_to_file, file_path=target_dir, file_name_suffix=file_name_suffix
+            )
             if verbose:
-                print(f"{i}: {saved_file_name}")
-                print("\nWORD LENGTHS")
-                print(trend_card.get_length(), end="\n" * 2)
-                i += 1
\ No newline at end of file
+                # emit each card's report with a single write so concurrent cards don't interleave
+                print(f"{i}: {saved_file_name}\n\nWORD LENGTHS\n{trend_card.get_length()}\n\n", end="")
+                i += 1
+
+        # a task group cancels the files still in flight as soon as one fails; re-raise that failure
+        # itself rather than the ExceptionGroup wrapping it, so callers see the original error
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for file in file_list:
+                    task_group.create_task(process(file))
+        except ExceptionGroup as group:
+            raise group.exceptions[0]
\ No newline at end of file
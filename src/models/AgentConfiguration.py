@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AgentConfiguration(BaseModel):
@@ -6,6 +6,8 @@ class AgentConfiguration(BaseModel):
     Parameters for constructing agents
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     model: str = Field(
         ...,
         description="The LLM model to be utilized by the agent"
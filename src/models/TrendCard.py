@@ -1,15 +1,33 @@
 import re
 from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import get_type_hints, Dict
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, Iterable, List
 
-from src.utils.fileio import append_to_filename
+from src.utils.fileio import append_to_filename, write_file
 
 
 # Word counting regex pattern that better matches MS Word's counting logic
 WORD_PATTERN = re.compile(r'\b[\w\']+\b')
 
 
+class _FileNameTable(dict):
+    """
+    str.translate table that maps every character that is neither a word character nor
+    whitespace to a space and leaves all others unchanged, filling itself in the first time
+    each character is seen.
+    """
+
+    def __missing__(self, codepoint: int) -> int:
+        char = chr(codepoint)
+        keep = char.isalnum() or char == '_' or char.isspace()
+        self[codepoint] = codepoint if keep else ord(' ')
+        return self[codepoint]
+
+
+# Translation table used to turn a card identifier into a file name
+FILE_NAME_TABLE = _FileNameTable()
+
+
 class TrendCard(BaseModel):
 
     card_identifier: str = Field(
@@ -37,16 +55,32 @@ class TrendCard(BaseModel):
         description="2-4 sentences highlighting opportunities the finding might present to businesses"
     )
 
-    challenges: str = Field(
+    challenges_threats: str = Field(
         ...,
-        alias="challenges_threats",
+        title="Challenges",
         description="2-4 sentences describing potential challenges/threats posed by the finding"
     )
 
-    class Config:
-        populate_by_name = True  # Allows using both 'challenges' and 'challenges_threats'
+    model_config = ConfigDict(defer_build=True)
 
 
+    @classmethod
+    def from_trusted(cls, data: dict) -> "TrendCard":
+        """
+        Creates a TrendCard from data that is already known to be valid, skipping validation.
+
+        Use this when re-creating cards from a trusted source, such as a cache written from
+        previously validated cards, or markdown saved by this class that has been parsed back
+        into a dictionary. Output from the LLM must still go through normal validation.
+
+        Args:
+            data (dict): Field values keyed by attribute name.
+
+        Returns:
+            TrendCard: A TrendCard populated with the given values.
+        """
+        return cls.model_construct(**data)
+
     def to_markdown(self, output_format: str = "**{title}:** {content}\n\n") -> str:
         """
         Converts the attributes of a TrendCard instance to a Markdown formatted string.
@@ -65,19 +99,11 @@ class TrendCard(BaseModel):
                 instance.
         """
 
-        card_content_markdown = ""
-
-        # Iterate through TrendCard attributes
-        for attr_name, attr_value in get_type_hints(TrendCard).items():
-            # Format attribute name as title
-            title = attr_name.replace('_', ' ').title()
-            content = getattr(self, attr_name)
-
-            # Add a formatted section
-            card_content_markdown += output_format.format(
-                title=title,
-                content=content,
-            )
+        # Format a section per TrendCard attribute and join them in one pass
+        card_content_markdown = "".join(
+            output_format.format(title=title, content=getattr(self, attr_name))
+            for attr_name, title in _SECTIONS
+        )
 
         return card_content_markdown.strip()
 
@@ -96,27 +122,52 @@ class TrendCard(BaseModel):
         Returns:
             str: The name of the saved file.
         """
+        return TrendCard.save_all_to_files([self], file_name_suffix, extension, file_path)[0]
+
+    @staticmethod
+    def save_all_to_files(trend_cards: Iterable["TrendCard"], file_name_suffix: str = None,
+                          extension: str = ".md", file_path: str = "../outputs") -> List[str]:
+        """
+        Saves several trend cards to files in the same directory, using the same naming convention
+        and file extension as `save_to_file`. The extension is checked and the directory is created
+        once for the whole batch rather than once per card.
+
+        Args:
+            trend_cards (Iterable[TrendCard]): The trend cards to save.
+            file_name_suffix (str, optional): The suffix to append to each file name. Defaults to None.
+            extension (str, optional): The desired file extension for the saved files. Defaults to ".md".
+            file_path (str, optional): The path where the files should be saved. Defaults to "../outputs".
+
+        Returns:
+            List[str]: The names of the saved files, in the same order as `trend_cards`.
+
+        Raises:
+            NotImplementedError: If the extension is not supported.
+        """
         # ensure the extension starts with a period
         if not extension.startswith('.'):
             extension = f'.{extension}'
 
-        file_name = self.card_identifier.lower()
-        file_name = re.sub(r'[^\w\s]', ' ', file_name)
-        file_name = re.sub(r'\s+', '_', file_name.strip()) + extension
-
-        if file_name_suffix:
-            file_name = append_to_filename(file_name, suffix=file_name_suffix)
+        match extension:
+            case ".md": render = TrendCard.to_markdown
+            case _: raise NotImplementedError(f"Extension '{extension}' not implemented.")
 
         path = Path(file_path)
         path.mkdir(parents=True, exist_ok=True)
 
-        output_path = path / file_name
+        file_names = []
+        for trend_card in trend_cards:
+            # replace punctuation with spaces, then join the remaining words with underscores
+            file_name = trend_card.card_identifier.lower().translate(FILE_NAME_TABLE)
+            file_name = '_'.join(file_name.split()) + extension
 
-        match extension:
-            case ".md": output_path.write_text(self.to_markdown(), encoding='utf-8')
-            case _: raise NotImplementedError(f"Extension '{extension}' not implemented.")
+            if file_name_suffix:
+                file_name = append_to_filename(file_name, suffix=file_name_suffix)
+
+            write_file(str(path / file_name), render(trend_card))
+            file_names.append(file_name)
 
-        return file_name
+        return file_names
 
     def get_length(self) -> Dict[str, int]:
         """
@@ -134,8 +185,16 @@ class TrendCard(BaseModel):
         """
         section_lengths = dict()
         # Iterate through TrendCard attributes
-        for attr_name in get_type_hints(TrendCard).keys():
+        for attr_name, _ in _SECTIONS:
             content = getattr(self, attr_name)
             section_lengths[attr_name] = len(WORD_PATTERN.findall(content))
 
-        return section_lengths
\ No newline at end of file
+        return section_lengths
+
+
+# (attribute name, section title) pairs in field order, computed once at import rather than on every call;
+# a field's explicit title takes precedence over the one derived from its name
+_SECTIONS = tuple(
+    (name, field.title or name.replace('_', ' ').title())
+    for name, field in TrendCard.model_fields.items()
+)
@@ -1,5 +1,5 @@
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TrendCardInput(BaseModel):
@@ -7,6 +7,8 @@ class TrendCardInput(BaseModel):
     Input parameters for generating a trend card.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     industry_segment: str = Field(
         ...,
         description="The industry segment to analyze (e.g., 'Payment processing platforms')"
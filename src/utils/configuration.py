@@ -1,6 +1,18 @@
 # IMPORTS
+import copy
+import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, List, Tuple
+
+# use the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+from src.utils.fileio import iter_files
 
 
 # PACKAGE MANAGEMENT
@@ -9,6 +21,14 @@ __all__ = [
 ]
 
 
+# MODULE STATE
+# existing config directories (nearest first), keyed by (working directory, config_dir_name)
+_CONFIG_DIR_CACHE: Dict[Tuple[str, str], List[Path]] = {}
+
+# file name -> file path for every file under a config directory, keyed by that directory
+_CONFIG_INDEX: Dict[str, Dict[str, str]] = {}
+
+
 # FUNCTIONS
 def load_config(filename: str, config_dir_name: str = "src/agents/config") -> dict:
     """
@@ -19,6 +39,9 @@ def load_config(filename: str, config_dir_name: str = "src/agents/config") -> di
     found, it is parsed and returned as a dictionary. If the file does not exist in the
     specified directory hierarchy, a FileNotFoundError is raised.
 
+    Parsed files are cached and only re-parsed when their modification time or size
+    changes. Callers always receive a deep copy, so they are free to mutate the result.
+
     Args:
         filename: Name of the configuration file to load.
         config_dir_name: Name of the directory to search for the configuration file.
@@ -31,11 +54,64 @@ def load_config(filename: str, config_dir_name: str = "src/agents/config") -> di
         FileNotFoundError: If the configuration file cannot be found in the specified
         directory or its parent directories.
     """
-    current = Path.cwd()
-    for parent in [current] + list(current.parents):
-        config_dir = parent / config_dir_name
-        if config_dir.exists():
-            for file_path in config_dir.rglob(filename):
-                with file_path.open('r', encoding='utf-8') as file:
-                    return yaml.safe_load(file)
+    file_path, stat = _find_config_path(filename, config_dir_name)
+    return copy.deepcopy(_load_yaml_cached(file_path, stat.st_mtime_ns, stat.st_size))
+
+
+def _find_config_path(filename: str, config_dir_name: str) -> Tuple[str, os.stat_result]:
+    """
+    Returns the path and stat result of the first file named `filename` under a
+    `config_dir_name` directory in the current working directory or one of its parents.
+
+    Raises:
+        FileNotFoundError: If no such file exists.
+    """
+    # search the cached directories and file indexes first, and only re-scan if that fails
+    for refresh in (False, True):
+        for config_dir in _get_config_dirs(config_dir_name, refresh):
+            file_path = _get_config_index(config_dir, refresh).get(filename)
+            if file_path is None:
+                continue
+            try:
+                return file_path, os.stat(file_path)
+            except FileNotFoundError:
+                break  # the cached index is stale, so scan again
     raise FileNotFoundError(f"Config file '{filename}' not found in any subdirectory under 'config' directory.")
+
+
+def _get_config_dirs(config_dir_name: str, refresh: bool = False) -> List[Path]:
+    """
+    Returns the existing `config_dir_name` directories in the current working directory
+    and its parents, nearest first. The result is cached per working directory so repeated
+    lookups skip the existence checks; pass `refresh=True` to scan again.
+    """
+    current = Path.cwd()
+    key = (str(current), config_dir_name)
+    if refresh or key not in _CONFIG_DIR_CACHE:
+        candidates = [parent / config_dir_name for parent in [current] + list(current.parents)]
+        _CONFIG_DIR_CACHE[key] = [config_dir for config_dir in candidates if config_dir.exists()]
+    return _CONFIG_DIR_CACHE[key]
+
+
+def _get_config_index(config_dir: Path, refresh: bool = False) -> Dict[str, str]:
+    """
+    Returns a mapping of file name to file path for every file under `config_dir`, built
+    with a single directory walk and cached; pass `refresh=True` to walk it again.
+    """
+    key = str(config_dir)
+    if refresh or key not in _CONFIG_INDEX:
+        index = {}
+        for file_path in iter_files(key, ""):
+            index.setdefault(os.path.basename(file_path), file_path)
+        _CONFIG_INDEX[key] = index
+    return _CONFIG_INDEX[key]
+
+
+@lru_cache(maxsize=128)
+def _load_yaml_cached(file_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parses a YAML file. Results are cached by path, modification time and size, so an
+    unchanged file is only parsed once while an edited file is parsed again.
+    """
+    # hand the raw bytes to the parser and let it decode them itself
+    return yaml.load(Path(file_path).read_bytes(), Loader=SafeLoader)
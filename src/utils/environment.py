@@ -1,15 +1,26 @@
-import nest_asyncio
-from dotenv import load_dotenv
-
-
 __all__ = [
     "set_up_env",
 ]
 
 
+# set once the environment (and, separately, tracing) has been set up, so repeat calls are no-ops
+_ENV_SET_UP = False
+_TRACING_SET_UP = False
+
+
 def set_up_env(trace: bool = False) -> None:
-    load_dotenv()
-    nest_asyncio.apply()
-    if trace:
+    global _ENV_SET_UP, _TRACING_SET_UP
+
+    if not _ENV_SET_UP:
+        # imported here so that importing src.utils doesn't pay for them unless the environment is set up
+        import nest_asyncio
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        nest_asyncio.apply()
+        _ENV_SET_UP = True
+
+    if trace and not _TRACING_SET_UP:
         import logfire
-        logfire.configure(send_to_logfire='if-token-present')
\ No newline at end of file
+        logfire.configure(send_to_logfire='if-token-present')
+        _TRACING_SET_UP = True
\ No newline at end of file
@@ -1,10 +1,18 @@
+import os
+import stat
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Sequence
 
 
 __all__ = [
     "get_file_list",
+    "iter_files",
     "read_file",
+    "read_files",
+    "write_file",
     "append_to_filename",
 ]
 
@@ -19,9 +27,10 @@ def get_file_list(path: str, extension: str, exclude_names_with: str = None) ->
 
     Args:
         path: The path to the directory where files are searched.
-        extension: The file extension to match.
+        extension: The file extension to match, or "" to match every file.
         exclude_names_with: An optional string; files containing this substring
-            in their names will be excluded from the list.
+            in their names, and everything in directories containing it in their names,
+            will be excluded from the list.
 
     Raises:
         FileNotFoundError: If the specified path does not exist.
@@ -30,26 +39,61 @@ def get_file_list(path: str, extension: str, exclude_names_with: str = None) ->
     Returns:
         List[str]: A list of file paths that match the criteria.
     """
-    path_obj = Path(path)
+    return list(iter_files(path, extension, exclude_names_with))
+
 
-    if not path_obj.exists():
-        raise FileNotFoundError(f"Path does not exist: {path}")
+def iter_files(path: str, extension: str, exclude_names_with: str = None) -> Iterator[str]:
+    """
+    Lazily yields all files with a specified extension from a given directory recursively.
 
-    if not path_obj.is_dir():
-        raise NotADirectoryError(f"Path is not a directory: {path}")
+    This is the generator behind `get_file_list`: it takes the same arguments and yields
+    the same file paths, but one at a time as the directory tree is walked, so callers that
+    only iterate once can start work before the walk finishes and never hold the full list.
+
+    Args:
+        path: The path to the directory where files are searched.
+        extension: The file extension to match, or "" to match every file.
+        exclude_names_with: An optional string; files containing this substring
+            in their names, and everything in directories containing it in their names,
+            will be skipped.
+
+    Raises:
+        FileNotFoundError: If the specified path does not exist (raised when iteration starts).
+        NotADirectoryError: If the specified path is not a directory (raised when iteration starts).
 
-    # Ensure the extension starts with a dot
-    if not extension.startswith('.'):
+    Yields:
+        str: The path of each file that matches the criteria.
+    """
+    path_obj = Path(path)
+
+    # Ensure the extension starts with a dot; an empty extension matches every file
+    if extension and not extension.startswith('.'):
         extension = f'.{extension}'
 
-    # Get all files with the specified extension
-    file_list = [str(file) for file in path_obj.rglob(f'*{extension}')]
+    # Walk the files with the specified extension, skipping excluded names while walking;
+    # os.scandir raises FileNotFoundError / NotADirectoryError for a bad path
+    yield from _scandir_recursive(str(path_obj), extension, exclude_names_with)
+
 
-    # apply name filter if specified
-    if exclude_names_with:
-        file_list = [file for file in file_list if not exclude_names_with in file]
+def _scandir_recursive(root: str, extension: str, exclude_names_with: str = None) -> Iterator[str]:
+    """
+    Yields the paths of all files under `root` whose names end with `extension`.
 
-    return file_list
+    Walks the tree with os.scandir, which reuses the file type information returned with
+    each directory listing instead of issuing a stat call per entry. Symbolic links to
+    directories are not followed. Files and directories whose names contain
+    `exclude_names_with` are skipped, so excluded subtrees are never listed.
+    """
+    directories = [root]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if exclude_names_with and exclude_names_with in entry.name:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif entry.name.endswith(extension) and entry.is_file():
+                    yield entry.path
 
 
 def read_file(file_path: str) -> str:
@@ -65,15 +109,72 @@ def read_file(file_path: str) -> str:
         FileNotFoundError: If the specified file does not exist.
         IOError: If there is an error when reading the file.
     """
-    path_obj = Path(file_path)
+    # read the whole file in one call and decode it once; a missing file raises FileNotFoundError
+    return Path(file_path).read_bytes().decode('utf-8')
 
-    if not path_obj.exists():
-        raise FileNotFoundError(f"File does not exist: {file_path}")
 
-    with open(path_obj, 'r', encoding='utf-8') as file:
-        content = file.read()
+def read_files(file_paths: Sequence[str], max_workers: int = 16) -> List[str]:
+    """Read several files concurrently and return their contents as strings.
 
-    return content
+    Each file is read with `read_file` on a pool of worker threads, so the reads
+    overlap instead of waiting on each other.
+
+    Args:
+        file_paths: The paths of the files to read.
+        max_workers: The maximum number of files read at the same time (default: 16).
+
+    Returns:
+        The contents of the files, in the same order as `file_paths`.
+
+    Raises:
+        FileNotFoundError: If any of the specified files does not exist.
+        IOError: If there is an error when reading a file.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(read_file, file_paths))
+
+
+def write_file(file_path: str, content: str) -> None:
+    """Write a string to a file as UTF-8, replacing any existing contents.
+
+    The content is encoded once and written with os.write, bypassing the
+    TextIOWrapper layer that re-encodes text in chunks. It is written to a
+    uniquely named temporary file next to the target which is then renamed
+    over it, so the target never holds a partially written file, even when
+    several writers target the same path at once. A new file gets the usual
+    permissions under the current umask; an existing file keeps its mode.
+
+    Args:
+        file_path: The path to the file to write.
+        content: The text to write to the file.
+
+    Raises:
+        FileNotFoundError: If the parent directory does not exist.
+        IOError: If there is an error when writing the file.
+    """
+    data = memoryview(content.encode('utf-8'))
+    # a uniquely named temporary file, so concurrent writers to the same target don't share one;
+    # creating it with mode 0o666 lets the kernel apply the current umask, as open() would
+    temp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        try:
+            # keep the mode of a file being overwritten, as writing it in place would
+            try:
+                os.chmod(temp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+            except FileNotFoundError:
+                pass
+            # os.write may write fewer bytes than requested, so keep going until everything is written
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        # don't leave the partial temporary file behind, and don't mask the original error
+        with suppress(OSError):
+            os.unlink(temp_path)
+        raise
 
 
 def append_to_filename(file_path: str, suffix: str, separator: str = "_") -> str:
@@ -97,14 +198,12 @@ def append_to_filename(file_path: str, suffix: str, separator: str = "_") -> str
         >>> append_to_filename('report.md', 'edited')
         'report_edited.md'
     """
-    path_obj = Path(file_path)
-
-    # Get the stem (filename without extension) and suffix (extension)
-    stem = path_obj.stem
-    extension = path_obj.suffix
-
-    # Create a new filename with appended suffix
-    new_filename = f"{stem}{separator}{suffix}{extension}"
-
-    # Return the full path with the new filename
-    return str(path_obj.parent / new_filename)
+    # Find where the filename starts and where its extension begins, following pathlib's rules:
+    # a leading or trailing dot does not start an extension
+    name_start = max(file_path.rfind(sep) for sep in (os.sep, os.altsep) if sep) + 1
+    dot = file_path.rfind('.', name_start)
+    if not name_start < dot < len(file_path) - 1:
+        dot = len(file_path)
+
+    # Insert the separator and suffix between the stem and the extension
+    return f"{file_path[:dot]}{separator}{suffix}{file_path[dot:]}"